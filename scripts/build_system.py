@@ -2,49 +2,52 @@
 from __future__ import annotations
 
 import argparse
+import array
+from concurrent.futures import ThreadPoolExecutor
+import functools
+import os
 from pathlib import Path
 import re
 import sys
-import textwrap
 
 
+_SLUG_RE = re.compile(r"[^a-z0-9-]+")
+_DASH_RE = re.compile(r"-+")
+
+_BOOL_WORDS = frozenset({"true", "false"})
+_NULL_WORDS = frozenset({"null", "none"})
+
+# Template strings are authored pre-dedented so nothing has to run
+# textwrap.dedent at import or render time.
 POLICY_MODULES = {
-    "plagiarism-check": textwrap.dedent(
-        """\
-        # Plagiarism Check Policy
-
-        - Use approved tooling to scan drafts for originality.
-        - Record tool name, version, and summary results in the PR body.
-        - Resolve or cite any flagged passages before requesting review.
-        """
-    ),
-    "copyright-compliance": textwrap.dedent(
-        """\
-        # Copyright Compliance Policy
-
-        - Only use content that is authored in-house or licensed for use.
-        - Document licenses and attributions in the PR body.
-        - Remove or replace content that cannot be cleared.
-        """
-    ),
-    "citations-required": textwrap.dedent(
-        """\
-        # Citations Required Policy
-
-        - Every factual claim must have a citation.
-        - List sources in the acceptance checklist or PR body.
-        - Prefer primary sources when available.
-        """
-    ),
-    "ai-assisted-disclosure": textwrap.dedent(
-        """\
-        # AI-Assisted Disclosure Policy
-
-        - Disclose AI assistance in the PR body.
-        - Document the prompts and tools used.
-        - Human reviewers must verify all outputs.
-        """
-    ),
+    "plagiarism-check": """\
+# Plagiarism Check Policy
+
+- Use approved tooling to scan drafts for originality.
+- Record tool name, version, and summary results in the PR body.
+- Resolve or cite any flagged passages before requesting review.
+""",
+    "copyright-compliance": """\
+# Copyright Compliance Policy
+
+- Only use content that is authored in-house or licensed for use.
+- Document licenses and attributions in the PR body.
+- Remove or replace content that cannot be cleared.
+""",
+    "citations-required": """\
+# Citations Required Policy
+
+- Every factual claim must have a citation.
+- List sources in the acceptance checklist or PR body.
+- Prefer primary sources when available.
+""",
+    "ai-assisted-disclosure": """\
+# AI-Assisted Disclosure Policy
+
+- Disclose AI assistance in the PR body.
+- Document the prompts and tools used.
+- Human reviewers must verify all outputs.
+""",
 }
 
 REQUIRED_FILES = [
@@ -96,7 +99,11 @@ def load_yaml(path: Path) -> dict:
 
     text = path.read_text(encoding="utf-8")
     if yaml is not None:
-        data = yaml.safe_load(text)
+        try:
+            from yaml import CSafeLoader as _Loader  # type: ignore
+        except ImportError:
+            from yaml import SafeLoader as _Loader  # type: ignore
+        data = yaml.load(text, Loader=_Loader)
         if data is None:
             return {}
         if not isinstance(data, dict):
@@ -107,7 +114,14 @@ def load_yaml(path: Path) -> dict:
 
 
 def parse_yaml_minimal(text: str) -> dict:
-    tokens = []
+    # Parallel flat containers instead of a list of per-line tuples: the
+    # recursive descent below re-reads indent/content many times, and
+    # array.array indexing plus a precomputed list-item bitmap keeps that
+    # cheap on the PyYAML-less fallback path.
+    indents = array.array("i")
+    contents: list[str] = []
+    line_nos = array.array("i")
+    is_list_item = bytearray()
     for line_no, raw in enumerate(text.splitlines(), start=1):
         if not raw.strip():
             continue
@@ -116,28 +130,32 @@ def parse_yaml_minimal(text: str) -> dict:
             continue
         if "\t" in raw:
             raise BriefError(f"Tabs are not supported in YAML (line {line_no}).")
-        indent = len(raw) - len(stripped)
-        tokens.append((indent, stripped.rstrip(), line_no))
-
-    if not tokens:
+        content = stripped.rstrip()
+        indents.append(len(raw) - len(stripped))
+        contents.append(content)
+        line_nos.append(line_no)
+        is_list_item.append(content.startswith("- "))
+
+    count = len(contents)
+    if not count:
         return {}
 
     def parse_block(idx: int, indent: int):
-        if idx >= len(tokens):
+        if idx >= count:
             return None, idx
-        if tokens[idx][0] != indent:
+        if indents[idx] != indent:
             raise BriefError(
-                f"Unexpected indentation at line {tokens[idx][2]}."
+                f"Unexpected indentation at line {line_nos[idx]}."
             )
-        if tokens[idx][1].startswith("- "):
+        if is_list_item[idx]:
             return parse_list(idx, indent)
         return parse_map(idx, indent)
 
     def parse_map(idx: int, indent: int):
         mapping: dict = {}
-        while idx < len(tokens) and tokens[idx][0] == indent:
-            content, line_no = tokens[idx][1], tokens[idx][2]
-            if content.startswith("- "):
+        while idx < count and indents[idx] == indent:
+            content, line_no = contents[idx], line_nos[idx]
+            if is_list_item[idx]:
                 raise BriefError(f"Unexpected list item at line {line_no}.")
             key, sep, value = content.partition(":")
             if not sep:
@@ -148,26 +166,26 @@ def parse_yaml_minimal(text: str) -> dict:
             if value:
                 mapping[key] = parse_scalar(value)
                 continue
-            if idx >= len(tokens) or tokens[idx][0] <= indent:
+            if idx >= count or indents[idx] <= indent:
                 mapping[key] = None
                 continue
-            child, idx = parse_block(idx, tokens[idx][0])
+            child, idx = parse_block(idx, indents[idx])
             mapping[key] = child
         return mapping, idx
 
     def parse_list(idx: int, indent: int):
         items = []
-        while idx < len(tokens) and tokens[idx][0] == indent:
-            content, line_no = tokens[idx][1], tokens[idx][2]
-            if not content.startswith("- "):
+        while idx < count and indents[idx] == indent:
+            if not is_list_item[idx]:
                 break
-            item_content = content[2:]
+            line_no = line_nos[idx]
+            item_content = contents[idx][2:]
             idx += 1
             if not item_content:
-                if idx >= len(tokens) or tokens[idx][0] <= indent:
+                if idx >= count or indents[idx] <= indent:
                     items.append(None)
                     continue
-                child, idx = parse_block(idx, tokens[idx][0])
+                child, idx = parse_block(idx, indents[idx])
                 items.append(child)
                 continue
             if ":" in item_content:
@@ -176,13 +194,13 @@ def parse_yaml_minimal(text: str) -> dict:
                 if value.strip():
                     item[key.strip()] = parse_scalar(value.strip())
                 else:
-                    if idx < len(tokens) and tokens[idx][0] > indent:
-                        child, idx = parse_block(idx, tokens[idx][0])
+                    if idx < count and indents[idx] > indent:
+                        child, idx = parse_block(idx, indents[idx])
                         item[key.strip()] = child
                     else:
                         item[key.strip()] = None
-                if idx < len(tokens) and tokens[idx][0] > indent:
-                    child, idx = parse_map(idx, tokens[idx][0])
+                if idx < count and indents[idx] > indent:
+                    child, idx = parse_map(idx, indents[idx])
                     if not isinstance(child, dict):
                         raise BriefError(
                             f"Expected mapping for list item at line {line_no}."
@@ -193,9 +211,9 @@ def parse_yaml_minimal(text: str) -> dict:
             items.append(parse_scalar(item_content.strip()))
         return items, idx
 
-    data, next_idx = parse_block(0, tokens[0][0])
-    if next_idx != len(tokens):
-        line_no = tokens[next_idx][2]
+    data, next_idx = parse_block(0, indents[0])
+    if next_idx != count:
+        line_no = line_nos[next_idx]
         raise BriefError(f"Unexpected content at line {line_no}.")
     if not isinstance(data, dict):
         raise BriefError("Brief YAML must be a mapping at the top level.")
@@ -207,15 +225,16 @@ def parse_scalar(value: str):
     if not value:
         return ""
     lowered = value.lower()
-    if lowered in {"true", "false"}:
+    if lowered in _BOOL_WORDS:
         return lowered == "true"
-    if lowered in {"null", "none"}:
+    if lowered in _NULL_WORDS:
         return None
-    if re.fullmatch(r"-?\d+", value):
+    first = value[0]
+    if first == "-" or "0" <= first <= "9":
         try:
             return int(value)
         except ValueError:
-            return value
+            pass
     if (
         (value.startswith("\"") and value.endswith("\""))
         or (value.startswith("'") and value.endswith("'"))
@@ -225,6 +244,8 @@ def parse_scalar(value: str):
 
 
 def strip_comment(value: str) -> str:
+    if "#" not in value:
+        return value.strip()
     in_single = False
     in_double = False
     for idx, char in enumerate(value):
@@ -365,22 +386,39 @@ def normalize_brief(data: dict):
 
 
 def slugify(name: str) -> str:
-    slug = re.sub(r"[^a-z0-9-]+", "-", name.lower().strip())
-    slug = re.sub(r"-+", "-", slug).strip("-")
+    if name.isascii():
+        # bytes.lower is a plain C tolower loop, without the Unicode
+        # case-folding tables str.lower consults.
+        lowered = name.encode("ascii").lower().decode("ascii").strip()
+    else:
+        lowered = name.lower().strip()
+    slug = _SLUG_RE.sub("-", lowered)
+    slug = _DASH_RE.sub("-", slug).strip("-")
     return slug or "role"
 
 
 def ensure_empty_dir(path: Path):
-    if path.exists() and any(path.iterdir()):
-        raise BriefError(f"Output path '{path}' is not empty.")
+    if path.exists():
+        # Stop at the first entry instead of materializing Path objects
+        # for the whole directory.
+        with os.scandir(path) as it:
+            if next(it, None) is not None:
+                raise BriefError(f"Output path '{path}' is not empty.")
     path.mkdir(parents=True, exist_ok=True)
 
 
-def write_file(path: Path, content: str):
-    path.parent.mkdir(parents=True, exist_ok=True)
-    if not content.endswith("\n"):
-        content += "\n"
-    path.write_text(content, encoding="utf-8")
+def _partition_by_parent(paths: list[str]) -> dict[str, list[str]]:
+    """Group relative paths by parent directory ('' for the root)."""
+    groups: dict[str, list[str]] = {}
+    for path in paths:
+        parent, _, name = path.rpartition("/")
+        groups.setdefault(parent, []).append(name)
+    return groups
+
+
+def write_bytes_file(path: Path, data: bytes):
+    assert data.endswith(b"\n")
+    path.write_bytes(data)
 
 
 def set_executable(path: Path):
@@ -404,10 +442,12 @@ def render_agents(brief: dict, open_questions: list[str]) -> str:
         "",
         "Roles:",
     ]
-    for role in roles:
-        lines.append(
+    lines.append(
+        "\n".join(
             f"- {role['name']}: {role['description']} ({role['slug']}/SKILL.md)"
+            for role in roles
         )
+    )
 
     lines.extend(
         [
@@ -426,8 +466,7 @@ def render_agents(brief: dict, open_questions: list[str]) -> str:
     if policies:
         lines.append("")
         lines.append("Policy Modules:")
-        for policy in policies:
-            lines.append(f"- {policy}")
+        lines.append("\n".join(f"- {policy}" for policy in policies))
 
     lines.extend(
         [
@@ -440,8 +479,7 @@ def render_agents(brief: dict, open_questions: list[str]) -> str:
     if open_questions:
         lines.append("")
         lines.append("Open Questions:")
-        for question in open_questions:
-            lines.append(f"- {question}")
+        lines.append("\n".join(f"- {question}" for question in open_questions))
 
     return "\n".join(lines)
 
@@ -459,20 +497,21 @@ def render_skills(brief: dict) -> str:
         "",
         "Roles:",
     ]
-    for role in roles:
-        lines.append(f"- {role['name']}: {role['slug']}/SKILL.md")
+    lines.append(
+        "\n".join(f"- {role['name']}: {role['slug']}/SKILL.md" for role in roles)
+    )
 
     if policies:
         lines.append("")
         lines.append("Policy Modules:")
-        for policy in policies:
-            lines.append(f"- {policy}")
+        lines.append("\n".join(f"- {policy}" for policy in policies))
 
     if references:
         lines.append("")
         lines.append("References:")
-        for ref in references:
-            lines.append(f"- {ref['path']}: {ref['purpose']}")
+        lines.append(
+            "\n".join(f"- {ref['path']}: {ref['purpose']}" for ref in references)
+        )
 
     lines.extend(
         [
@@ -485,186 +524,220 @@ def render_skills(brief: dict) -> str:
     return "\n".join(lines)
 
 
-def render_process_contract() -> str:
-    return textwrap.dedent(
-        """\
-        # Agent Process Contract
+_PROCESS_CONTRACT = """\
+# Agent Process Contract
 
-        This system uses a PR-driven workflow with explicit agent roles.
+This system uses a PR-driven workflow with explicit agent roles.
 
-        ## Contract Rules
-        - All work happens in a dedicated worktree per PR.
-        - The PR body must include an `Agent-Status: ...` line.
-        - Each PR must reference the relevant role acceptance criteria.
-        - No destructive commands are permitted in scripts or workflows.
-        - Approvals are required for any external tooling not listed in policies.
+## Contract Rules
+- All work happens in a dedicated worktree per PR.
+- The PR body must include an `Agent-Status: ...` line.
+- Each PR must reference the relevant role acceptance criteria.
+- No destructive commands are permitted in scripts or workflows.
+- Approvals are required for any external tooling not listed in policies.
 
-        ## Suggested Workflow
-        1. Read the relevant role skill and the acceptance checklist.
-        2. Create a worktree using `scripts/agent-worktree.sh`.
-        3. Execute the scoped tasks and record updates in the PR body.
-        4. Run validation (`python3 scripts/validate_skills.py`).
-        5. Request review when acceptance criteria are met.
-        """
-    )
+## Suggested Workflow
+1. Read the relevant role skill and the acceptance checklist.
+2. Create a worktree using `scripts/agent-worktree.sh`.
+3. Execute the scoped tasks and record updates in the PR body.
+4. Run validation (`python3 scripts/validate_skills.py`).
+5. Request review when acceptance criteria are met.
+"""
 
+_PROCESS_CONTRACT_BYTES = _PROCESS_CONTRACT.encode("utf-8")
 
-def render_pr_body_template() -> str:
-    return textwrap.dedent(
-        """\
-        # Summary
 
-        Agent-Status: Draft
+_PR_BODY_TEMPLATE = """\
+# Summary
 
-        ## Scope
-        -
+Agent-Status: Draft
 
-        ## Acceptance Checklist
-        - [ ] See templates/acceptance-checklist.md
+## Scope
+-
 
-        ## Risks / Notes
-        -
-        """
-    )
+## Acceptance Checklist
+- [ ] See templates/acceptance-checklist.md
 
+## Risks / Notes
+-
+"""
 
-def render_acceptance_checklist() -> str:
-    return textwrap.dedent(
-        """\
-        # Acceptance Checklist
+_PR_BODY_TEMPLATE_BYTES = _PR_BODY_TEMPLATE.encode("utf-8")
 
-        - [ ] Acceptance criteria from the assigned role skill are satisfied.
-        - [ ] Required policy modules are followed and documented.
-        - [ ] PR body includes `Agent-Status: ...` and scope notes.
-        - [ ] Validation script passes (`python3 scripts/validate_skills.py`).
-        """
-    )
 
+_ACCEPTANCE_CHECKLIST = """\
+# Acceptance Checklist
 
-def render_role_skill(role: dict, policies: list[str], references: list[dict]) -> str:
-    lines = [
-        f"# {role['name']} Skill",
-        "",
-        "## Mission",
-        role["description"],
-        "",
-        "## Responsibilities",
-        "- Translate the role description into PR-scoped deliverables.",
-        "- Maintain the PR body status using `Agent-Status: ...`.",
-        "- Coordinate with other roles when dependencies arise.",
-        "",
-        "## Workflow",
-        "1. Review `agent-process-contract.md` and the acceptance checklist.",
-        "2. Create a worktree with `scripts/agent-worktree.sh`.",
-        "3. Execute the scoped work and capture updates in the PR body.",
-        "4. Validate outputs with `python3 scripts/validate_skills.py`.",
-        "",
-        "## Acceptance Criteria",
-        "- Responsibilities are complete and reflected in the PR scope.",
-        "- PR body includes an up-to-date `Agent-Status: ...` line.",
-        "- Acceptance checklist is fully satisfied.",
-    ]
+- [ ] Acceptance criteria from the assigned role skill are satisfied.
+- [ ] Required policy modules are followed and documented.
+- [ ] PR body includes `Agent-Status: ...` and scope notes.
+- [ ] Validation script passes (`python3 scripts/validate_skills.py`).
+"""
+
+_ACCEPTANCE_CHECKLIST_BYTES = _ACCEPTANCE_CHECKLIST.encode("utf-8")
+
+
+_SKILL_SECTIONS = """\
+## Responsibilities
+- Translate the role description into PR-scoped deliverables.
+- Maintain the PR body status using `Agent-Status: ...`.
+- Coordinate with other roles when dependencies arise.
+
+## Workflow
+1. Review `agent-process-contract.md` and the acceptance checklist.
+2. Create a worktree with `scripts/agent-worktree.sh`.
+3. Execute the scoped work and capture updates in the PR body.
+4. Validate outputs with `python3 scripts/validate_skills.py`.
+
+## Acceptance Criteria
+- Responsibilities are complete and reflected in the PR scope.
+- PR body includes an up-to-date `Agent-Status: ...` line.
+- Acceptance checklist is fully satisfied.\
+"""
 
-    if policies:
-        lines.append("- Policy modules are followed and documented.")
+
+@functools.lru_cache(maxsize=None)
+def _build_skill_tail(
+    policies: tuple[str, ...], references: tuple[tuple[str, str], ...]
+) -> str:
+    """Everything below the per-role Mission section.
+
+    Identical for every role in a brief, so it is built once per
+    (policies, references) combination and shared across roles.
+    """
+    lines = [_SKILL_SECTIONS]
 
     if policies:
+        lines.append("- Policy modules are followed and documented.")
         lines.extend(["", "## Policy Modules"])
-        for policy in policies:
-            lines.append(f"- {policy}")
+        lines.append("\n".join(f"- {policy}" for policy in policies))
 
     if references:
         lines.extend(["", "## References"])
-        for ref in references:
-            lines.append(f"- {ref['path']}: {ref['purpose']}")
+        lines.append(
+            "\n".join(f"- {path}: {purpose}" for path, purpose in references)
+        )
 
     return "\n".join(lines)
 
 
+def render_role_skill(role: dict, tail: str) -> str:
+    return (
+        f"# {role['name']} Skill\n"
+        "\n"
+        "## Mission\n"
+        f"{role['description']}\n"
+        "\n" + tail
+    )
+
+
 def render_reference_stub(path: str, purpose: str) -> str:
     title = Path(path).stem.replace("-", " ").title()
-    return textwrap.dedent(
-        f"""\
-        # {title}
+    return f"""\
+# {title}
 
-        Purpose: {purpose}
+Purpose: {purpose}
 
-        - Add detailed guidance here.
-        """
-    )
+- Add detailed guidance here.
+"""
 
 
-def render_worktree_script() -> str:
-    return textwrap.dedent(
-        """\
-        #!/usr/bin/env bash
-        set -euo pipefail
+_WORKTREE_SCRIPT = """\
+#!/usr/bin/env bash
+set -euo pipefail
 
-        if [ "$#" -lt 2 ]; then
-          echo "Usage: $0 <branch-name> <worktree-path>"
-          exit 1
-        fi
+if [ "$#" -lt 2 ]; then
+  echo "Usage: $0 <branch-name> <worktree-path>"
+  exit 1
+fi
 
-        branch="$1"
-        worktree_path="$2"
+branch="$1"
+worktree_path="$2"
 
-        if ! git rev-parse --git-dir >/dev/null 2>&1; then
-          echo "Error: run from inside a git repository."
-          exit 1
-        fi
+if ! git rev-parse --git-dir >/dev/null 2>&1; then
+  echo "Error: run from inside a git repository."
+  exit 1
+fi
 
-        if git show-ref --verify --quiet "refs/heads/$branch"; then
-          git worktree add "$worktree_path" "$branch"
-        else
-          git worktree add -b "$branch" "$worktree_path"
-        fi
-        """
-    )
+if git show-ref --verify --quiet "refs/heads/$branch"; then
+  git worktree add "$worktree_path" "$branch"
+else
+  git worktree add -b "$branch" "$worktree_path"
+fi
+"""
 
+_WORKTREE_SCRIPT_BYTES = _WORKTREE_SCRIPT.encode("utf-8")
 
-def render_chat_script() -> str:
-    return textwrap.dedent(
-        """\
-        #!/usr/bin/env bash
-        set -euo pipefail
-
-        if [ "$#" -lt 2 ]; then
-          echo "Usage: $0 <role> <message>"
-          exit 1
-        fi
-
-        role="$1"
-        message="$2"
-        log_dir="${LOG_DIR:-logs}"
-        mkdir -p "$log_dir"
-        timestamp=$(date -u +"%Y-%m-%dT%H:%M:%SZ")
-        printf "[%s] [%s] %s\n" "$timestamp" "$role" "$message" >> "$log_dir/agent-chat.log"
-        """
-    )
 
+_CHAT_SCRIPT = """\
+#!/usr/bin/env bash
+set -euo pipefail
 
-def render_scaffold_script() -> str:
-    return textwrap.dedent(
-        """\
-        #!/usr/bin/env bash
-        set -euo pipefail
+if [ "$#" -lt 2 ]; then
+  echo "Usage: $0 <role> <message>"
+  exit 1
+fi
 
-        if ! command -v gh >/dev/null 2>&1; then
-          echo "GitHub CLI (gh) is required to scaffold draft PRs."
-          exit 1
-        fi
+role="$1"
+message="$2"
+log_dir="${LOG_DIR:-logs}"
+mkdir -p "$log_dir"
+timestamp=$(date -u +"%Y-%m-%dT%H:%M:%SZ")
+printf "[%s] [%s] %s\\n" "$timestamp" "$role" "$message" >> "$log_dir/agent-chat.log"
+"""
 
-        if [ "$#" -lt 2 ]; then
-          echo "Usage: $0 <branch-name> <title>"
-          exit 1
-        fi
+_CHAT_SCRIPT_BYTES = _CHAT_SCRIPT.encode("utf-8")
 
-        branch="$1"
-        title="$2"
 
-        gh pr create --draft --title "$title" --body-file templates/pr-body.md --head "$branch"
-        """
-    )
+_SCAFFOLD_SCRIPT = """\
+#!/usr/bin/env bash
+set -euo pipefail
+
+if ! command -v gh >/dev/null 2>&1; then
+  echo "GitHub CLI (gh) is required to scaffold draft PRs."
+  exit 1
+fi
+
+if [ "$#" -lt 2 ]; then
+  echo "Usage: $0 <branch-name> <title>"
+  exit 1
+fi
+
+branch="$1"
+title="$2"
+
+gh pr create --draft --title "$title" --body-file templates/pr-body.md --head "$branch"
+"""
+
+_SCAFFOLD_SCRIPT_BYTES = _SCAFFOLD_SCRIPT.encode("utf-8")
+
+
+_SELF_BYTES: bytes | None = None
+
+
+def _self_bytes() -> bytes:
+    """Source of this script, read once and reused across briefs."""
+    global _SELF_BYTES
+    if _SELF_BYTES is None:
+        _SELF_BYTES = Path(__file__).resolve().read_bytes()
+    return _SELF_BYTES
+
+
+_VALIDATE_SRC_BYTES: bytes | None = None
+
+
+def _validate_src_bytes() -> bytes:
+    """Source of validate_skills.py, read once and reused across briefs.
+
+    The generated copy is byte-identical to the script shipped next to
+    this file, so there is no embedded template to keep in sync.
+    """
+    global _VALIDATE_SRC_BYTES
+    if _VALIDATE_SRC_BYTES is None:
+        _VALIDATE_SRC_BYTES = (
+            Path(__file__).resolve().parent / "validate_skills.py"
+        ).read_bytes()
+    return _VALIDATE_SRC_BYTES
 
 
 def generate(output: Path, brief: dict, open_questions: list[str]):
@@ -674,32 +747,59 @@ def generate(output: Path, brief: dict, open_questions: list[str]):
     templates = brief["templates"]
     workflow = brief["workflow"]
 
-    write_file(output / "AGENTS.md", render_agents(brief, open_questions))
-    write_file(output / "SKILLS.md", render_skills(brief))
-    write_file(output / "agent-process-contract.md", render_process_contract())
-
+    # Create every needed directory once up-front so the write calls
+    # below skip per-file mkdir/stat syscalls.
     scripts_dir = output / "scripts"
-    write_file(scripts_dir / "validate_skills.py", render_validation_script())
-    write_file(scripts_dir / "agent-worktree.sh", render_worktree_script())
-    write_file(scripts_dir / "agent-chat.sh", render_chat_script())
+    dirs_needed = {
+        output,
+        scripts_dir,
+        (output / templates["pr_body"]).parent,
+        (output / templates["acceptance_checklist"]).parent,
+    }
+    for role in roles:
+        dirs_needed.add(output / role["slug"])
+    for ref in references:
+        dirs_needed.add((output / ref["path"]).parent)
+    if policies:
+        dirs_needed.add(output / "references/policies")
+    for directory in dirs_needed:
+        directory.mkdir(parents=True, exist_ok=True)
+
+    # Collect every file as (path, bytes) and write them concurrently:
+    # the writes are independent, and write_bytes releases the GIL for
+    # the duration of the syscall.
+    pending: dict[Path, bytes] = {}
+
+    def queue_file(path: Path, content: str):
+        if not content.endswith("\n"):
+            content += "\n"
+        pending[path] = content.encode("utf-8")
+
+    queue_file(output / "AGENTS.md", render_agents(brief, open_questions))
+    queue_file(output / "SKILLS.md", render_skills(brief))
+    pending[output / "agent-process-contract.md"] = _PROCESS_CONTRACT_BYTES
 
-    build_system_path = Path(__file__).resolve()
-    write_file(scripts_dir / "build_system.py", build_system_path.read_text(encoding="utf-8"))
+    pending[scripts_dir / "validate_skills.py"] = _validate_src_bytes()
+    pending[scripts_dir / "agent-worktree.sh"] = _WORKTREE_SCRIPT_BYTES
+    pending[scripts_dir / "agent-chat.sh"] = _CHAT_SCRIPT_BYTES
 
-    write_file(output / templates["pr_body"], render_pr_body_template())
-    write_file(output / templates["acceptance_checklist"], render_acceptance_checklist())
+    pending[scripts_dir / "build_system.py"] = _self_bytes()
 
+    pending[output / templates["pr_body"]] = _PR_BODY_TEMPLATE_BYTES
+    pending[output / templates["acceptance_checklist"]] = _ACCEPTANCE_CHECKLIST_BYTES
+
+    skill_tail = _build_skill_tail(
+        tuple(policies),
+        tuple((ref["path"], ref["purpose"]) for ref in references),
+    )
     for role in roles:
         role_dir = output / role["slug"]
-        write_file(
-            role_dir / "SKILL.md",
-            render_role_skill(role, policies, references),
-        )
+        queue_file(role_dir / "SKILL.md", render_role_skill(role, skill_tail))
 
     reference_paths = set()
     for ref in references:
         reference_paths.add(ref["path"])
-        write_file(output / ref["path"], render_reference_stub(ref["path"], ref["purpose"]))
+        queue_file(output / ref["path"], render_reference_stub(ref["path"], ref["purpose"]))
 
     for policy in policies:
         policy_path = f"references/policies/{policy}.md"
@@ -708,14 +808,27 @@ def generate(output: Path, brief: dict, open_questions: list[str]):
         policy_text = POLICY_MODULES.get(policy)
         if policy_text is None:
             policy_text = render_reference_stub(policy_path, "Policy module guidance.")
-        write_file(output / policy_path, policy_text)
+        queue_file(output / policy_path, policy_text)
 
     if workflow["create_draft_prs"]:
-        write_file(output / "scripts/scaffold_prs.sh", render_scaffold_script())
+        pending[output / "scripts/scaffold_prs.sh"] = _SCAFFOLD_SCRIPT_BYTES
 
-    for rel_path in REQUIRED_FILES:
-        if not (output / rel_path).exists():
-            raise BriefError(f"Missing required file: {rel_path}")
+    # Keying pending by path keeps last-wins semantics for briefs that
+    # map two entries to the same file, so concurrent writes never race.
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda item: write_bytes_file(*item), pending.items()))
+
+    # One scandir per parent directory instead of one stat per file.
+    for parent, names in _partition_by_parent(REQUIRED_FILES).items():
+        try:
+            with os.scandir(os.path.join(output, parent)) as it:
+                present = {entry.name for entry in it}
+        except FileNotFoundError:
+            present = set()
+        for name in names:
+            if name not in present:
+                rel_path = f"{parent}/{name}" if parent else name
+                raise BriefError(f"Missing required file: {rel_path}")
 
     for script in [
         output / "scripts/agent-worktree.sh",
@@ -728,89 +841,6 @@ def generate(output: Path, brief: dict, open_questions: list[str]):
             set_executable(script)
 
 
-def render_validation_script() -> str:
-    return textwrap.dedent(
-        """\
-        #!/usr/bin/env python3
-        from __future__ import annotations
-
-        import sys
-        from pathlib import Path
-
-
-        REQUIRED_FILES = [
-            "AGENTS.md",
-            "SKILLS.md",
-            "agent-process-contract.md",
-            "scripts/build_system.py",
-            "scripts/validate_skills.py",
-            "scripts/agent-worktree.sh",
-            "scripts/agent-chat.sh",
-            "templates/pr-body.md",
-            "templates/acceptance-checklist.md",
-        ]
-
-        SKIP_DIRS = {"scripts", "templates", "references", "assets", "logs"}
-
-
-        def main() -> int:
-            root = Path(__file__).resolve().parents[1]
-            errors = []
-
-            for rel in REQUIRED_FILES:
-                if not (root / rel).exists():
-                    errors.append(f"Missing required file: {rel}")
-
-            pr_body = root / "templates/pr-body.md"
-            if pr_body.exists():
-                text = pr_body.read_text(encoding="utf-8")
-                if "Agent-Status:" not in text:
-                    errors.append("PR body template missing 'Agent-Status:' line.")
-
-            agents = root / "AGENTS.md"
-            if agents.exists():
-                text = agents.read_text(encoding="utf-8")
-                if "agent-process-contract.md" not in text:
-                    errors.append("AGENTS.md must reference agent-process-contract.md.")
-
-            roles = []
-            for entry in root.iterdir():
-                if not entry.is_dir():
-                    continue
-                if entry.name in SKIP_DIRS:
-                    continue
-                skill_path = entry / "SKILL.md"
-                if skill_path.exists():
-                    roles.append(entry)
-                    text = skill_path.read_text(encoding="utf-8")
-                    if "Acceptance Criteria" not in text:
-                        errors.append(
-                            f"{entry.name}/SKILL.md missing Acceptance Criteria section."
-                        )
-                    if "Workflow" not in text:
-                        errors.append(
-                            f"{entry.name}/SKILL.md missing Workflow section."
-                        )
-
-            if not roles:
-                errors.append("No role SKILL.md files found.")
-
-            if errors:
-                print("Validation failed:")
-                for error in errors:
-                    print(f"- {error}")
-                return 1
-
-            print("Validation passed.")
-            return 0
-
-
-        if __name__ == "__main__":
-            raise SystemExit(main())
-        """
-    )
-
-
 def main() -> int:
     args = parse_args()
     brief_path = Path(args.brief)
@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
+import os
+import re
 import sys
 from pathlib import Path
 
@@ -19,42 +21,71 @@ REQUIRED_FILES = [
 
 SKIP_DIRS = {"scripts", "templates", "references", "assets", "logs"}
 
+# Both SKILL.md sentinels are found in one pass over the file.
+_SKILL_RE = re.compile(rb"Acceptance Criteria|Workflow")
+
+
+def _partition_by_parent(paths: list[str]) -> dict[str, list[str]]:
+    """Group relative paths by parent directory ('' for the root)."""
+    groups: dict[str, list[str]] = {}
+    for path in paths:
+        parent, _, name = path.rpartition("/")
+        groups.setdefault(parent, []).append(name)
+    return groups
+
 
 def main() -> int:
     root = Path(__file__).resolve().parents[1]
+    root_str = str(root)
     errors = []
 
-    for rel in REQUIRED_FILES:
-        if not (root / rel).exists():
-            errors.append(f"Missing required file: {rel}")
+    # One scandir per parent directory instead of one stat per file.
+    for parent, names in _partition_by_parent(REQUIRED_FILES).items():
+        try:
+            with os.scandir(os.path.join(root_str, parent)) as it:
+                present = {entry.name for entry in it}
+        except FileNotFoundError:
+            present = set()
+        for name in names:
+            if name not in present:
+                rel = f"{parent}/{name}" if parent else name
+                errors.append(f"Missing required file: {rel}")
 
-    pr_body = root / "templates/pr-body.md"
-    if pr_body.exists():
-        text = pr_body.read_text(encoding="utf-8")
-        if "Agent-Status:" not in text:
+    pr_body = os.path.join(root_str, "templates/pr-body.md")
+    # The sentinels are pure ASCII, so the files are scanned as bytes
+    # without a UTF-8 decode pass.
+    if os.path.exists(pr_body):
+        with open(pr_body, "rb") as fh:
+            data = fh.read()
+        if b"Agent-Status:" not in data:
             errors.append("PR body template missing 'Agent-Status:' line.")
 
-    agents = root / "AGENTS.md"
-    if agents.exists():
-        text = agents.read_text(encoding="utf-8")
-        if "agent-process-contract.md" not in text:
+    agents = os.path.join(root_str, "AGENTS.md")
+    if os.path.exists(agents):
+        with open(agents, "rb") as fh:
+            data = fh.read()
+        if b"agent-process-contract.md" not in data:
             errors.append("AGENTS.md must reference agent-process-contract.md.")
 
     roles = []
-    for entry in root.iterdir():
-        if not entry.is_dir():
-            continue
-        if entry.name in SKIP_DIRS:
-            continue
-        skill_path = entry / "SKILL.md"
-        if skill_path.exists():
+    with os.scandir(root) as it:
+        role_dirs = [
+            entry
+            for entry in it
+            if entry.is_dir(follow_symlinks=False) and entry.name not in SKIP_DIRS
+        ]
+    for entry in role_dirs:
+        skill_path = os.path.join(entry.path, "SKILL.md")
+        if os.path.isfile(skill_path):
             roles.append(entry)
-            text = skill_path.read_text(encoding="utf-8")
-            if "Acceptance Criteria" not in text:
+            with open(skill_path, "rb") as fh:
+                data = fh.read()
+            found = set(_SKILL_RE.findall(data))
+            if b"Acceptance Criteria" not in found:
                 errors.append(
                     f"{entry.name}/SKILL.md missing Acceptance Criteria section."
                 )
-            if "Workflow" not in text:
+            if b"Workflow" not in found:
                 errors.append(f"{entry.name}/SKILL.md missing Workflow section.")
 
     if not roles: